@@ -5,10 +5,12 @@ Usage:
 
 """
 
+from functools import cache
 from typing import Any
 
 import matplotlib
 import networkx as nx
+import numpy as np
 
 from topologiq.core.graph_manager.utils import reindex_path_dict
 from topologiq.core.pathfinder.pathfinder import pathfinder
@@ -19,6 +21,68 @@ from topologiq.vis.blockgraph import vis_3d
 from topologiq.vis.common import lattice_to_g
 
 
+#######################
+# TENTATIVE POSITIONS #
+#######################
+def _gen_tent_offsets(moves: np.ndarray, max_manhattan: int = 9) -> dict[int, np.ndarray]:
+    """Expand layers of tentative target offsets around the origin, one move at a time.
+
+    Args:
+        moves: The displacements used to expand from one layer to the next.
+        max_manhattan: Max. (Manhattan) distance of the last layer to generate.
+
+    Returns:
+        tent_offsets: The offsets of tentative target coordinates for each layer.
+
+    """
+
+    tent_offsets = {3: moves}
+    base_offsets = moves
+
+    for layer in range(6, max_manhattan + 1, 3):
+        layer_offsets = (base_offsets[:, None, :] + moves[None, :, :]).reshape(-1, 3)
+        tent_offsets[layer] = layer_offsets[np.any(layer_offsets != 0, axis=1)]
+        base_offsets = np.concatenate([base_offsets, layer_offsets])
+
+    return tent_offsets
+
+
+@cache
+def _gen_lattice_offsets(max_manhattan: int) -> np.ndarray:
+    """Enumerate the offsets of all lattice points within a (Manhattan) distance of the origin.
+
+    Args:
+        max_manhattan: Max. (Manhattan) distance between origin and lattice points.
+
+    Returns:
+        lattice_offsets: The offsets of all lattice points (multiples of 3) at distance 3 to `max_manhattan`.
+
+    """
+
+    units = max_manhattan // 3
+    unit_range = range(-units, units + 1)
+    lattice_offsets = [
+        (i * 3, j * 3, k * 3)
+        for i in unit_range
+        for j in unit_range
+        for k in unit_range
+        if 0 < abs(i) + abs(j) + abs(k) <= units
+    ]
+
+    return np.array(lattice_offsets, dtype=np.int64)
+
+
+# Offsets of tentative target coordinates for the first three layers
+# Note. Layers 3 to 9 keep the duplicates of the original layer-by-layer expansion, so the number of
+# targets the pathfinder must fill is unchanged. Layers beyond 9 are deduplicated (see `_gen_lattice_offsets()`)
+# because the expansion grows into thousands of duplicate candidates there.
+TENT_MOVES = np.array(
+    [(3, 0, 0), (-3, 0, 0), (0, 3, 0), (0, -3, 0), (0, 0, 3), (0, 0, -3)],
+    dtype=np.int64,
+)
+TENT_OFFSETS = _gen_tent_offsets(TENT_MOVES)
+
+
 ##############
 # PATHFINDER #
 ##############
@@ -80,6 +144,10 @@ def call_pathfinder(
     # if tgt_coords and tgt_coords in taken_cc:
     if tgt_coords:
         taken_cc.remove(tgt_coords)
+    taken_cc_set = set(taken_cc)
+
+    # Lookup for tentative target generation, only built if needed and then reused across steps
+    taken_set = None
 
     # Loop call the inner pathfinder in case there is a need to re-run the pathfinder
     max_step = init_step if tgt_block_info else 15
@@ -88,10 +156,12 @@ def call_pathfinder(
         if tgt_coords:
             tent_coords = [tgt_coords]
         else:
+            if taken_set is None:
+                taken_set = set(taken)
             tent_coords = _gen_tent_tgt_coords(
                 src_coords,
                 step,
-                taken,  # Real occupied coords: position cannot overlap start node
+                taken_set,  # Real occupied coords: position cannot overlap start node
             )
 
         # Try finding paths to each tentative coordinates
@@ -115,8 +185,9 @@ def call_pathfinder(
             for path in valid_paths.values():
                 path_checks = True
                 for node in path:
-                    if node[0] in taken_cc:
+                    if node[0] in taken_cc_set:
                         path_checks = False
+                        break
                 if path_checks:
                     clean_paths.append(path)
 
@@ -133,14 +204,14 @@ def call_pathfinder(
 def _gen_tent_tgt_coords(
     src_c: StandardCoord,
     max_manhattan: int = 3,
-    taken: list[StandardCoord] = [],
+    taken: list[StandardCoord] | set[StandardCoord] = [],
 ) -> list[StandardCoord]:
     """Generate a number of potential placement positions for target node.
 
     Args:
         src_c: The (x, y, z) coordinates for the originating block.
         max_manhattan: Max. (Manhattan) distance between origin and target blocks.
-        taken: A list of coordinates already taken by previous operations.
+        taken: A list or set of coordinates already taken by previous operations.
 
     Returns:
         all_coords_at_distance: A list of tentative target coordinates that make good candidates for placing the target block.
@@ -149,72 +220,22 @@ def _gen_tent_tgt_coords(
 
     # EXTRACT SOURCE COORDS
     sx, sy, sz = src_c
-    base_for_next_layer = []
-    tent_coords = {}
-
-    # SINGLE MOVES
-    tgts = [
-        (sx + 3, sy, sz),
-        (sx - 3, sy, sz),
-        (sx, sy + 3, sz),
-        (sx, sy - 3, sz),
-        (sx, sy, sz + 3),
-        (sx, sy, sz - 3),
-    ]
-    tent_coords[3] = [t for t in tgts if t not in taken]
-    base_for_next_layer = [t for t in tgts]
-
-    # MANHATTAN 6
-    if max_manhattan > 3:
-        tent_coords[6] = []
-        for dx, dy, dz in [c for c in base_for_next_layer]:
-            tgts = [
-                (dx + 3, dy, dz),
-                (dx - 3, dy, dz),
-                (dx, dy + 3, dz),
-                (dx, dy - 3, dz),
-                (dx, dy, dz + 3),
-                (dx, dy, dz - 3),
-            ]
-            tent_coords[6].extend([t for t in tgts if t not in taken and t != src_c])
-            base_for_next_layer.extend([t for t in tgts])
-
-    # MANHATTAN 9
-    if max_manhattan > 6:
-        tent_coords[9] = []
-        for dx, dy, dz in [c for c in base_for_next_layer]:
-            tgts = [
-                (dx + 3, dy, dz),
-                (dx - 3, dy, dz),
-                (dx, dy + 3, dz),
-                (dx, dy - 3, dz),
-                (dx, dy, dz + 3),
-                (dx, dy, dz - 3),
-            ]
-            tent_coords[9].extend([t for t in tgts if t not in taken and t != src_c])
-            base_for_next_layer.extend([t for t in tgts])
+
+    # MANHATTAN 3, 6, AND 9
+    # Note. Offsets are precomputed, so only the shift to source coords happens per call
+    if max_manhattan <= 9:
+        tent_offsets = TENT_OFFSETS[max_manhattan]
 
     # > MANHATTAN 9
-    if max_manhattan > 9:
-        tent_coords[max_manhattan] = []
-        num_loops = int((max_manhattan - 9) / 3)
-
-        for _ in [i + 1 for i in range(num_loops)]:
-            for dx, dy, dz in [c for c in base_for_next_layer]:
-                tgts = [
-                    (dx + 3, dy, dz),
-                    (dx - 3, dy, dz),
-                    (dx, dy + 3, dz),
-                    (dx, dy - 3, dz),
-                    (dx, dy, dz + 3),
-                    (dx, dy, dz - 3),
-                ]
-                tent_coords[max_manhattan].extend(
-                    [t for t in tgts if t not in taken and t != src_c]
-                )
-                base_for_next_layer.extend([t for t in tgts])
-
-    all_coords_at_distance = tent_coords[min(max_manhattan, 15)]
+    # Note. Enumerate every lattice point up to the distance once rather than expanding layers,
+    # which yields the same coordinates without duplicates (unlike the layers above)
+    else:
+        tent_offsets = _gen_lattice_offsets(min(max_manhattan, 15))
+
+    # Discard taken coords
+    taken = taken if isinstance(taken, set) else set(taken)
+    tgts = [(sx + dx, sy + dy, sz + dz) for dx, dy, dz in tent_offsets.tolist()]
+    all_coords_at_distance = [t for t in tgts if t not in taken]
     return all_coords_at_distance
 
 
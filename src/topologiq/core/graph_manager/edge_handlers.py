@@ -15,7 +15,7 @@ from topologiq.core.graph_manager.beams import check_path_to_beam_clashes, check
 from topologiq.core.graph_manager.callers import call_debug_vis, call_pathfinder
 from topologiq.core.graph_manager.utils import get_node_degree, prune_beams, update_edge_paths
 from topologiq.core.pathfinder.spatial import get_taken_coords
-from topologiq.core.pathfinder.symbolic import check_exits
+from topologiq.core.pathfinder.symbolic import check_exits, index_taken_by_line
 from topologiq.utils.classes import (
     Colors,
     CubeBeams,
@@ -120,6 +120,8 @@ def handle_std_edge(
         # Note. A smart subset of clean paths
         viable_paths = []
         tgt_degree = int(get_node_degree(nx_g, tgt_id))
+        exits_cache = {}  # Note. Only valid while `taken_coords_c` is unchanged
+        taken_lines = index_taken_by_line(taken_coords_c)
         for clean_path in clean_paths:
             # Extract key path information
             tgt_coords, tgt_kind = clean_path[-1]
@@ -127,7 +129,12 @@ def handle_std_edge(
 
             # Check if exits are unobstructed
             tgt_unobstr_exit_n, tgt_beams, tgt_beams_short = check_exits(
-                tgt_coords, tgt_kind, taken_coords_c, coords_in_path
+                tgt_coords,
+                tgt_kind,
+                taken_coords_c,
+                coords_in_path,
+                exits_cache=exits_cache,
+                taken_lines=taken_lines,
             )
 
             # Check path doesn't obstruct an absolutely necessary exit for a pre-existing cube
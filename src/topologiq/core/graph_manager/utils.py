@@ -149,6 +149,7 @@ def enforce_max_four_legs_per_spider(nx_g: nx.Graph) -> nx.Graph:
                 kind=None,
                 coords=None,
                 beams=None,
+                beams_short=None,
                 completed=0,
             )
             nx_g.add_edge(node_to_sanitise, twin_node_id, type="SIMPLE")
@@ -366,33 +367,34 @@ def prune_beams(nx_g: nx.Graph, taken: list[StandardCoord]) -> nx.Graph:
 
     """
 
-    try:
-        for n_id in nx_g.nodes():
-            new_beams = []
-            new_beams_short = []
-            if nx_g.nodes[n_id]["completed"] == []:
-                pass
-            elif nx_g.nodes[n_id]["completed"] >= get_node_degree(nx_g, n_id):
-                nx_g.nodes[n_id]["beams"] = []
-                nx_g.nodes[n_id]["beams_short"] = []
-            else:
-                old_beams = nx_g.nodes[n_id]["beams"]
-                old_beams_short = nx_g.nodes[n_id]["beams_short"]
-
-                if old_beams:
-                    for single_beam in old_beams:
-                        if not any([single_beam.contains(coord) for coord in taken]):
-                            new_beams += [single_beam]
-                    nx_g.nodes[n_id]["beams"] = new_beams
-
-                if old_beams_short:
-                    for single_beam_short in old_beams_short:
-                        if not any([single_beam_short.contains(coord) for coord in taken]):
-                            new_beams_short += [single_beam_short]
-                    nx_g.nodes[n_id]["beams_short"] = new_beams_short
-
-    except (IndexError, ValueError, LookupError, KeyError):
-        pass
+    # Deduplicate taken once, as every beam is checked against it
+    taken_set = set(taken)
+
+    for n_id in nx_g.nodes():
+        new_beams = []
+        new_beams_short = []
+        if nx_g.nodes[n_id]["completed"] == []:
+            pass
+        elif nx_g.nodes[n_id]["completed"] >= get_node_degree(nx_g, n_id):
+            nx_g.nodes[n_id]["beams"] = []
+            nx_g.nodes[n_id]["beams_short"] = []
+        else:
+            old_beams = nx_g.nodes[n_id]["beams"]
+            old_beams_short = nx_g.nodes[n_id]["beams_short"]
+
+            # Infinite beams cannot be materialised, so check containment (stops on first clash)
+            if old_beams:
+                for single_beam in old_beams:
+                    if not any(single_beam.contains(coord) for coord in taken_set):
+                        new_beams += [single_beam]
+                nx_g.nodes[n_id]["beams"] = new_beams
+
+            # Short beams are finite, so compare their coordinates to taken directly
+            if old_beams_short:
+                for single_beam_short in old_beams_short:
+                    if taken_set.isdisjoint(single_beam_short.covered_coords):
+                        new_beams_short += [single_beam_short]
+                nx_g.nodes[n_id]["beams_short"] = new_beams_short
 
     return nx_g
 
@@ -430,62 +432,32 @@ def reindex_path_dict(
         }
         edge_paths = new_edge_paths
 
-    max_id = 0
-    idx_paths = {}
-    for path in edge_paths.values():
-        max_id = max(max_id, path["src_tgt_ids"][0], path["src_tgt_ids"][1])
+    # Start numbering intermediate blocks after the highest spider ID
+    max_id = max([0, *(max(path["src_tgt_ids"]) for path in edge_paths.values())])
     nxt_id = max_id + 1
 
+    # Walk each path once, writing cubes and pipes as they are reached
+    lat_nodes: dict[int, StandardBlock] = {}
+    lat_edges: dict[tuple[int, int], list[str]] = {}
     for path in edge_paths.values():
-        idxd_path = {}
         key_1, key_2 = path["src_tgt_ids"]
         path_nodes = path["path_nodes"]
+        last_idx = len(path_nodes) - 1
 
-        idxd_path[key_1] = path_nodes[0]
-
-        for i in range(1, len(path_nodes) - 1):
-            mid_node = path_nodes[i]
-            idxd_path[nxt_id] = mid_node
+        # Keep the original IDs for the ends of the path and assign new IDs to everything else
+        n_ids = [key_1]
+        for _ in range(1, last_idx):
+            n_ids.append(nxt_id)
             nxt_id += 1
+        if last_idx > 0:
+            n_ids.append(key_2)
 
-        if len(path_nodes) > 1:
-            idxd_path[key_2] = path_nodes[-1]
-
-        idx_paths[(key_1, key_2)] = idxd_path
-
-    final_edges = {}
-    for orig_key, path_id_value_map in idx_paths.items():
-        n_ids = list(path_id_value_map.keys())
-        b_ids = []
-        e_ids = []
-
-        for i in range(len(n_ids)):
-            if i % 2 == 0:
-                b_ids.append(n_ids[i])
-            else:
-                e_ids.append(n_ids[i])
-
-        if len(b_ids) >= 2:
-            for i in range(len(b_ids) - 1):
-                n1 = b_ids[i]
-                n2 = b_ids[i + 1]
-                e_type = path_id_value_map[e_ids[i]][1]
-
-                final_edges[(n1, n2)] = [e_type, orig_key]
-
-    lat_nodes: dict[int, StandardBlock] = {}
-    lat_edges: dict[tuple[int, int], list[str]] = {}
-    for path in idx_paths.values():
-        keys = list(path.keys())
-        i = 0
-        for key, info in path.items():
+        # Even positions hold cubes and odd positions hold the pipes between them
+        for i, (n_id, block) in enumerate(zip(n_ids, path_nodes)):
             if i % 2 == 0:
-                lat_nodes[key] = info
+                lat_nodes[n_id] = block
             else:
-                e_key = (keys[i - 1], keys[i + 1])
-                e_type = info[1]
-                lat_edges[e_key] = [e_type, final_edges[e_key][1]]
-            i += 1
+                lat_edges[(n_ids[i - 1], n_ids[i + 1])] = [block[1], (key_1, key_2)]
 
     return lat_nodes, lat_edges
 
@@ -30,8 +30,35 @@ from topologiq.utils.classes import CubeBeams, StandardCoord
 ###############
 # CROSS EDGES #
 ###############
+def collect_critical_beam_coords(
+    critical_beams: dict[StandardCoord, int, tuple[int, CubeBeams], tuple[int, CubeBeams]],
+) -> dict[int, list[frozenset[StandardCoord]]]:
+    """Collect the coordinates of the short beams in a critical beams object, per cube.
+
+    Short beams have a finite length, so they can be converted into sets of coordinates
+    and then checked against paths using hashed lookups, rather than calling
+    `SingleBeam.contains()` for every coordinate on every move. Each beam keeps its
+    coordinates once materialised, so only beams added since the last run cost anything.
+
+    Args:
+        critical_beams: A dictionary containing beam information for cubes with beams.
+
+    Returns:
+        critical_beams_coords: The coordinates of each short beam, keyed by cube ID
+            and in the same order as the short beams in `critical_beams`.
+
+    """
+
+    critical_beams_coords = {}
+    for cube_id, (_, _, _, cube_beams_short) in critical_beams.items():
+        critical_beams_coords[cube_id] = [beam.covered_coords for beam in cube_beams_short]
+
+    return critical_beams_coords
+
+
 def check_critical_beams(
     critical_beams: dict[StandardCoord, int, tuple[int, CubeBeams], tuple[int, CubeBeams]],
+    critical_beams_coords: dict[int, list[frozenset[StandardCoord]]],
     full_path_coords: list[StandardCoord],
     nxt_coords: StandardCoord,
     tgt_coords: StandardCoord,
@@ -41,6 +68,7 @@ def check_critical_beams(
 
     Args:
         critical_beams: A dictionary containing beam information for cubes with beams.
+        critical_beams_coords: The short beams in `critical_beams` as sets of coordinates.
         full_path_coords: All coordinates occupied by current path.
         nxt_coords: The coordinates being checked as potential next position to place a block.
         tgt_coords: The final "target" coordinates at which path should arrive.
@@ -58,8 +86,8 @@ def check_critical_beams(
 
         # Look for clashes against path
         broken_beams = [
-            any([out_beam.contains(coord) for coord in full_path_coords])
-            for out_beam in out_beams_short
+            not out_beam_coords.isdisjoint(full_path_coords)
+            for out_beam_coords in critical_beams_coords[out_id]
         ]
 
         out_clash_tracker = out_clash_tracker + np.array(broken_beams)
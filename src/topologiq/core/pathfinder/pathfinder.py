@@ -22,6 +22,7 @@ Notes:
 
 from collections import deque
 
+from topologiq.core.pathfinder.beams import collect_critical_beam_coords
 from topologiq.core.pathfinder.spatial import (
     check_skip_move,
     gen_bounding_box,
@@ -210,6 +211,11 @@ def core_pathfinder_bfs(
     second_pass, taken = check_run_mode(src_coords, taken, tgt_coords, tent_tgt_kinds)
     bounding_box, max_span = gen_bounding_box(taken, second_pass=second_pass)
 
+    # Hashed copies of coordinates used for membership checks on every move
+    taken_set = set(taken)
+    tgt_coords_set = set(tgt_coords)
+    critical_beams_coords = collect_critical_beam_coords(critical_beams)
+
     # Initialise BFS
     queue, visited, visit_attempts, path_len, path, valid_paths, all_search_paths, moves = init_bfs(
         src_block_info
@@ -235,7 +241,7 @@ def core_pathfinder_bfs(
             pass  # Need to eventually delete, leaving it here for debugging purposes
 
         # Check for success
-        if curr_coords in tgt_coords:
+        if curr_coords in tgt_coords_set:
             if _check_for_success(current_block, tent_tgt_kinds, path, valid_paths, tgts_to_fill):
                 break
             else:
@@ -252,8 +258,9 @@ def core_pathfinder_bfs(
             if check_skip_move(
                 nxt_coords,
                 tgt_coords,
-                taken,
+                taken_set,
                 critical_beams,
+                critical_beams_coords,
                 src_tgt_ids,
                 second_pass,
                 bounding_box,
@@ -116,10 +116,8 @@ def get_coords_for_current_move(
     curr_path_coords = [n[0] for n in path[current_block]]
 
     # Calculate coordinates for the full path
-    try:
-        full_path_coords = get_taken_coords(path[current_block])
-    except Exception as _:
-        full_path_coords = curr_path_coords
+    # Note. `get_taken_coords()` already returns early for empty paths and skips empty blocks
+    full_path_coords = get_taken_coords(path[current_block])
 
     return nxt_coords, curr_path_coords, full_path_coords, mid_coords
 
@@ -177,8 +175,9 @@ def gen_bounding_box(
 def check_skip_move(
     nxt_coords: StandardCoord,
     tgt_coords: list[StandardCoord],
-    taken: list[StandardCoord],
+    taken: set[StandardCoord],
     critical_beams: dict[StandardCoord, int, tuple[int, CubeBeams], tuple[int, CubeBeams]],
+    critical_beams_coords: dict[int, list[frozenset[StandardCoord]]],
     src_tgt_ids: tuple[int, int],
     second_pass: bool,
     bounding_box: dict[str, dict[str, int]],
@@ -192,8 +191,9 @@ def check_skip_move(
     Args:
         nxt_coords: The coordinates being checked as potential next position to place a block.
         tgt_coords: The final "target" coordinates at which path should arrive.
-        taken: A list of all coordinates occupied by any blocks/pipes placed throughout the algorithmic process.
+        taken: A set of all coordinates occupied by any blocks/pipes placed throughout the algorithmic process.
         critical_beams: An object containing beams considered critical for future operations.
+        critical_beams_coords: The short beams in `critical_beams` as sets of coordinates.
         src_tgt_ids: The exact IDs of the source and target cubes.
         second_pass: Whether the current BFS is part of a cross-edge operation.
         bounding_box: The coordinates determining the bounding box outside of which moves are not allowed.
@@ -226,7 +226,12 @@ def check_skip_move(
 
     if critical_beams and "o" not in curr_kind:
         if not check_critical_beams(
-            critical_beams, full_path_coords, nxt_coords, tgt_coords, src_tgt_ids
+            critical_beams,
+            critical_beams_coords,
+            full_path_coords,
+            nxt_coords,
+            tgt_coords,
+            src_tgt_ids,
         ):
             return True
 
@@ -5,6 +5,9 @@ Usage:
 
 """
 
+from functools import cache
+from itertools import product
+
 import numpy as np
 
 from topologiq.utils.classes import (
@@ -15,6 +18,16 @@ from topologiq.utils.classes import (
     StandardCoord,
 )
 
+# Unit displacements towards each face of a block, in (+, -) pairs per axis
+DIRECTIONS: tuple[StandardCoord, ...] = (
+    (1, 0, 0),
+    (-1, 0, 0),
+    (0, 1, 0),
+    (0, -1, 0),
+    (0, 0, 1),
+    (0, 0, -1),
+)
+
 
 ####################
 # COMPOSITE CHECKS #
@@ -54,6 +67,11 @@ def check_exits(
     src_k: str | None,
     taken: list[StandardCoord],
     coords_in_path: list[StandardCoord],
+    exits_cache: dict[
+        tuple[StandardCoord, StandardCoord], tuple[bool, SingleBeam | None, SingleBeam | None]
+    ]
+    | None = None,
+    taken_lines: dict[tuple[int, int, int], tuple[int, int]] | None = None,
 ) -> tuple[int, CubeBeams, CubeBeams]:
     """Find the number of unobstructed exits for an arbitrary block.
 
@@ -66,6 +84,9 @@ def check_exits(
         src_k: The kind of the block.
         taken: A list of coordinates taken by any blocks placed as a result of previous operations.
         coords_in_path: The coordinates taken by the path under current evaluation.
+        exits_cache (optional): A dictionary reused across calls that share the same `taken`,
+            to avoid re-checking the same face of a block more than once.
+        taken_lines (optional): `taken` indexed by line, as given by `index_taken_by_line()`.
 
     Returns:
         unobstr_exits_n: the number of unobstructed exist for the block.
@@ -73,34 +94,40 @@ def check_exits(
 
     """
 
-    unobstr_exits_n = 0
     cube_beams = []
     cube_beams_short = []
 
-    diffs = [
-        (1, 0, 0),
-        (-1, 0, 0),
-        (0, 1, 0),
-        (0, -1, 0),
-        (0, 0, 1),
-        (0, 0, -1),
-    ]
+    # Exit axes depend only on the kind, so look them up once rather than once per face
+    exit_mask = _exit_axis_mask(src_k.lower()[:3] if isinstance(src_k, str) else "")
+
+    for i, d in enumerate(DIRECTIONS):
+        # Faces come in pairs, one pair per axis
+        if not exit_mask[i // 2]:
+            continue
 
-    for d in diffs:
         tgt_c = (
             src_c[0] + d[0],
             src_c[1] + d[1],
             src_c[2] + d[2],
         )
 
-        if check_is_exit(src_c, src_k, tgt_c):
-            is_unobstr, single_beam, single_beam_short = check_unobstructed(src_c, tgt_c, taken)
-            if is_unobstr and not any([single_beam.contains(coord) for coord in coords_in_path]):
-                unobstr_exits_n += 1
-                cube_beams.append(single_beam)
-                cube_beams_short.append(single_beam_short)
+        # Note. Obstruction depends only on the face and `taken`, so callers evaluating many
+        # paths against the same `taken` can share results across calls via `exits_cache`
+        if exits_cache is None:
+            is_unobstr, single_beam, single_beam_short = check_unobstructed(
+                src_c, tgt_c, taken, taken_lines=taken_lines
+            )
+        else:
+            face = (src_c, tgt_c)
+            if face not in exits_cache:
+                exits_cache[face] = check_unobstructed(src_c, tgt_c, taken, taken_lines=taken_lines)
+            is_unobstr, single_beam, single_beam_short = exits_cache[face]
+
+        if is_unobstr and not any([single_beam.contains(coord) for coord in coords_in_path]):
+            cube_beams.append(single_beam)
+            cube_beams_short.append(single_beam_short)
 
-    # Reset number of unobstructed exits
+    # Number of unobstructed exits
     unobstr_exits_n = len(cube_beams)
     return unobstr_exits_n, cube_beams, cube_beams_short
 
@@ -147,33 +174,44 @@ def check_is_exit(src_c: StandardCoord, src_k: str | None, tgt_c: StandardCoord)
     """
 
     src_k = src_k.lower()[:3] if isinstance(src_k, str) else ""
-    kind_3d = [src_k[0], src_k[1], src_k[2]]
+    exit_mask = _exit_axis_mask(src_k)
+
+    # The first axis with a displacement determines the face
+    for src, tgt, is_exit in zip(src_c, tgt_c, exit_mask):
+        if tgt != src:
+            return is_exit
+
+    return False
+
+
+@cache
+def _exit_axis_mask(kind_3d: str) -> tuple[bool, bool, bool]:
+    """Determine which axes of a block are exits (cached, as there are only a few kinds).
+
+    Args:
+        kind_3d: the first three characters of a block's/pipe's kind, in lowercase.
+
+    Returns:
+        exit_mask: a boolean for each axis, True if the faces on that axis are exits.
+
+    """
+
+    kind_3d = [kind_3d[0], kind_3d[1], kind_3d[2]]
 
     if "o" in kind_3d:
         marker = "o"
     else:
         marker = [i for i in set(kind_3d) if kind_3d.count(i) >= 2][0]
 
-    exit_idxs = [i for i, char in enumerate(kind_3d) if char == marker]
-    diffs = [tgt - src for src, tgt in zip(src_c, tgt_c)]
-
-    diff_idx = -1
-    for i, diff in enumerate(diffs):
-        if diff != 0:
-            diff_idx = i
-            break
-
-    if diff_idx != -1 and diff_idx in exit_idxs:
-        return True
-    else:
-        return False
+    return tuple(char == marker for char in kind_3d)
 
 
 def check_unobstructed(
     src_c: StandardCoord,
     tgt_c: StandardCoord,
     taken: list[StandardCoord],
-) -> tuple[bool, SingleBeam]:
+    taken_lines: dict[tuple[int, int, int], tuple[int, int]] | None = None,
+) -> tuple[bool, SingleBeam | None, SingleBeam | None]:
     """Check if a face is unobstructed.
 
     This function should typically be called after verifying a face is exit.
@@ -182,16 +220,22 @@ def check_unobstructed(
         src_c: The (x, y, z) coordinates for the current block/pipe.
         tgt_c: The coordinates for the target block/pipe.
         taken: The list of coordinates taken by any blocks/pipes placed as a result of previous operations.
+        taken_lines (optional): `taken` indexed by line, as given by `index_taken_by_line()`.
 
     Returns:
         (bool): True if face is unobstructed else False.
-        single_beam: If the face is unobstructed, its corresponding beam.
+        single_beam: If the face is unobstructed, its corresponding beam (else None).
+        single_beam_short: If the face is unobstructed, its corresponding short beam (else None).
 
     """
 
     diffs = [target - source for source, target in zip(src_c, tgt_c)]
     diffs = [1 if d > 0 else -1 if d < 0 else 0 for d in diffs]
 
+    # Check obstruction first, so beams are only built for faces that need them
+    if taken and _check_ray_obstructed(src_c, diffs, taken, taken_lines=taken_lines):
+        return False, None, None
+
     x_start, x_end, x_direction = (
         src_c[0],
         src_c[0] if diffs[0] == 0 else diffs[0] * np.inf,
@@ -236,13 +280,87 @@ def check_unobstructed(
         BeamAxisComponent(z_start, z_end, z_direction),
     )
 
-    if not taken:
-        return True, single_beam, single_beam_short
+    return True, single_beam, single_beam_short
+
 
-    if any([single_beam.contains(coord) for coord in taken]):
-        return False, single_beam, single_beam_short
+def _check_ray_obstructed(
+    src_c: StandardCoord,
+    direction: list[int],
+    taken: list[StandardCoord],
+    taken_lines: dict[tuple[int, int, int], tuple[int, int]] | None = None,
+) -> bool:
+    """Check if any taken coordinate sits on the infinite beam leaving a block in a given direction.
 
-    return True, single_beam, single_beam_short
+    Equivalent to calling `SingleBeam.contains()` on an infinite beam for each taken coordinate,
+    but reduced to plain integer comparisons because this check runs for every exit of every
+    tentative target.
+
+    Args:
+        src_c: The (x, y, z) coordinates for the current block/pipe.
+        direction: The unit displacement for the beam, with a single non-zero axis.
+        taken: The list of coordinates taken by any blocks/pipes placed as a result of previous operations.
+        taken_lines (optional): `taken` indexed by line, as given by `index_taken_by_line()`.
+
+    Returns:
+        (bool): True if a taken coordinate obstructs the beam else False.
+
+    """
+
+    axis = 0 if direction[0] else 1 if direction[1] else 2
+    fixed_1, fixed_2 = [i for i in range(3) if i != axis]
+    sign = direction[axis]
+    src_pos, src_fixed_1, src_fixed_2 = src_c[axis], src_c[fixed_1], src_c[fixed_2]
+
+    # Only the extremes of the line matter: the ray is obstructed if any taken coordinate lies ahead
+    if taken_lines is not None:
+        line_bounds = taken_lines.get((axis, src_fixed_1, src_fixed_2))
+        if line_bounds is None:
+            return False
+        return line_bounds[1] > src_pos if sign > 0 else line_bounds[0] < src_pos
+
+    for coord in taken:
+        if (
+            coord[fixed_1] == src_fixed_1
+            and coord[fixed_2] == src_fixed_2
+            and (coord[axis] - src_pos) * sign > 0
+        ):
+            return True
+
+    return False
+
+
+def index_taken_by_line(
+    taken: list[StandardCoord],
+) -> dict[tuple[int, int, int], tuple[int, int]]:
+    """Index taken coordinates by the axis-aligned lines that pass through them.
+
+    Beams are infinite rays along a single axis, so whether a beam is obstructed depends only
+    on the taken coordinates on its line. Indexing `taken` by line once lets repeated checks
+    against the same `taken` run in constant time rather than scanning every coordinate.
+
+    Args:
+        taken: The list of coordinates taken by any blocks/pipes placed as a result of previous operations.
+
+    Returns:
+        taken_lines: (axis, fixed coord 1, fixed coord 2) -> (min, max) position of taken
+            coordinates along the axis, for every line with at least one taken coordinate.
+
+    """
+
+    taken_lines = {}
+    for coord in taken:
+        for axis, fixed_1, fixed_2 in ((0, 1, 2), (1, 0, 2), (2, 0, 1)):
+            key = (axis, coord[fixed_1], coord[fixed_2])
+            pos = coord[axis]
+            line_bounds = taken_lines.get(key)
+            if line_bounds is None:
+                taken_lines[key] = (pos, pos)
+            elif pos < line_bounds[0]:
+                taken_lines[key] = (pos, line_bounds[1])
+            elif pos > line_bounds[1]:
+                taken_lines[key] = (line_bounds[0], pos)
+
+    return taken_lines
 
 
 def face_match(src_c: StandardCoord, src_k: str, tgt_c: StandardCoord, tgt_k: str) -> bool:
@@ -367,9 +485,8 @@ def handle_kind_after_hadamard(
 def rotate_pipe(k: str) -> str:
     """Rotate a pipe around its length.
 
-    This function enables pipe rotation by using the exit marker in their kind
-    to create a rotational matrix, which is then used to rotate the original kind
-    using symbolic multiplication.
+    This function looks the rotation up in `ROTATED_PIPES`, which is precomputed for all pipe
+    kinds using `_rotate_pipe_symbolic()`, and only computes rotations for any other input.
 
     Args:
         k: the kind of the pipe that needs rotation.
@@ -379,30 +496,34 @@ def rotate_pipe(k: str) -> str:
 
     """
 
-    h_flag = False
-    if "h" in k:
-        h_flag = True
-        k.replace("h", "")
+    rot_k = ROTATED_PIPES.get(k)
+    return rot_k if rot_k is not None else _rotate_pipe_symbolic(k)
+
 
-    # Build rotation matrix based on placement of "o" node
-    idxs = [0, 1, 2]
-    idxs.remove(k.index("o"))
+def _rotate_pipe_symbolic(k: str) -> str:
+    """Rotate a pipe around its length.
 
-    new_matrix = {
-        k.index("o"): np.eye(3, dtype=int)[k.index("o")],
-        idxs[0]: np.eye(3, dtype=int)[idxs[1]],
-        idxs[1]: np.eye(3, dtype=int)[idxs[0]],
-    }
+    This function rotates a pipe by keeping the exit marker ("o") in place
+    and swapping the two remaining characters of its kind.
 
-    rot_matrix = np.array([new_matrix[0], new_matrix[1], new_matrix[2]])
+    Args:
+        k: the kind of the pipe that needs rotation.
+
+    Returns:
+        rot_k: a kind with the rotation incorporated into the new name.
 
-    # Rotate kind
-    rot_k = ""
-    for r in rot_matrix:
-        entry = ""
-        for j, ele in enumerate(r):
-            entry += abs(int(ele)) * k[j]
-        rot_k += entry
+    """
+
+    h_flag = False
+    if "h" in k:
+        h_flag = True
+        k = k.replace("h", "")
+
+    # Swap the two characters that are not the "o" marker
+    rot_k = list(k)
+    i, j = [idx for idx in range(3) if idx != k.index("o")]
+    rot_k[i], rot_k[j] = k[j], k[i]
+    rot_k = "".join(rot_k)
 
     if h_flag:
         rot_k += "h"
@@ -410,6 +531,26 @@ def rotate_pipe(k: str) -> str:
     return rot_k
 
 
+# Rotations for every pipe kind (with and without Hadamard flag), computed once at import
+ROTATED_PIPES: dict[str, str] = {
+    k + h: _rotate_pipe_symbolic(k + h)
+    for a, b in product("xz", repeat=2)
+    for k in (a + b + "o", a + "o" + b, "o" + a + b)
+    for h in ("", "h")
+}
+
+
+# Hadamard equivalences, listed in both directions
+HADAMARD_FLIPS: dict[str, str] = {
+    "zxoh": "xzoh",
+    "xzoh": "zxoh",
+    "xozh": "zoxh",
+    "zoxh": "xozh",
+    "oxzh": "ozxh",
+    "ozxh": "oxzh",
+}
+
+
 def flip_hadamard(k: str) -> str:
     """Flip a Hadamard for the opposite Hadamard with length on the same axis.
 
@@ -421,15 +562,4 @@ def flip_hadamard(k: str) -> str:
 
     """
 
-    # list of hadamard equivalences
-    equivs = {"zxoh": "xzoh", "xozh": "zoxh", "oxzh": "ozxh"}
-
-    # Match to equivalent block given direction
-    if k in equivs.keys():
-        new_k = equivs[k]
-    else:
-        inv_equivs = {v: k for k, v in equivs.items()}
-        new_k = inv_equivs[k]
-
-    # Return revised kind
-    return new_k
+    return HADAMARD_FLIPS[k]
@@ -11,6 +11,19 @@ import numpy as np
 
 from topologiq.utils.classes import StandardBlock, StandardCoord
 
+###############
+# COORDINATES #
+###############
+# Unit moves explored by the BFS, in the order they are tried
+BFS_MOVES: tuple[StandardCoord, ...] = (
+    (1, 0, 0),
+    (0, 1, 0),
+    (0, 0, 1),
+    (-1, 0, 0),
+    (0, -1, 0),
+    (0, 0, -1),
+)
+
 #################
 # HEALTH CHECKS #
 #################
@@ -29,7 +42,7 @@ def init_bfs(
     dict[StandardBlock, list[StandardBlock]],
     dict[StandardBlock, list[StandardBlock]],
     dict[StandardBlock, list[StandardBlock]],
-    list[tuple[int, int, int]],
+    tuple[StandardCoord, ...],
 ]:
     """Initialise BFS variables."""
 
@@ -40,16 +53,8 @@ def init_bfs(
     path = {src_block_info: [src_block_info]}
     valid_paths = {}
     all_search_paths = {}
-    moves = [
-        (1, 0, 0),
-        (0, 1, 0),
-        (0, 0, 1),
-        (-1, 0, 0),
-        (0, -1, 0),
-        (0, 0, -1),
-    ]
 
-    return queue, visited, visit_attempts, path_len, path, valid_paths, all_search_paths, moves
+    return queue, visited, visit_attempts, path_len, path, valid_paths, all_search_paths, BFS_MOVES
 
 
 def gen_exit_conditions(
@@ -63,16 +68,14 @@ def gen_exit_conditions(
     )
 
     # Manhattan distances to skip iterations and exit BFS in the event of failure
+    src_tgt_manhattan = get_max_manhattan(src_coords, tent_coords)
     if not second_pass:
-        max_manhattan = get_max_manhattan(src_coords, tent_coords) * 2
-        src_tgt_manhattan = max_manhattan
+        max_manhattan = src_tgt_manhattan * 2
     else:
-        src_tgt_manhattan = get_max_manhattan(src_coords, tent_coords)
         max_manhattan = max(
             get_max_manhattan(src_coords, taken) * 2,
             max_span,
         )
-    src_tgt_manhattan = get_max_manhattan(src_coords, tent_coords)
 
     return tgts_to_fill, max_manhattan, src_tgt_manhattan
 
@@ -146,7 +149,9 @@ def get_manhattan(src_coords: StandardCoord, tgt_coords: StandardCoord) -> int:
 
     """
 
-    return np.sum(np.abs(np.array(src_coords) - np.array(tgt_coords)))
+    sx, sy, sz = src_coords
+    tx, ty, tz = tgt_coords
+    return abs(tx - sx) + abs(ty - sy) + abs(tz - sz)
 
 
 def get_max_manhattan(src_coord: StandardCoord, all_coords: list[StandardCoord]) -> int:
@@ -162,6 +167,7 @@ def get_max_manhattan(src_coord: StandardCoord, all_coords: list[StandardCoord])
     """
 
     if all_coords:
-        return max([get_manhattan(src_coord, c) for c in all_coords])
+        diffs = np.abs(np.asarray(all_coords) - np.asarray(src_coord))
+        return int(diffs.sum(axis=1).max())
 
     return 0
@@ -6,6 +6,7 @@ Usage:
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TypedDict
 
 import numpy as np
@@ -129,6 +130,28 @@ class SingleBeam:
         x, y, z = coords_to_check
         return self.x.contains(x) and self.y.contains(y) and self.z.contains(z)
 
+    @cached_property
+    def covered_coords(self) -> frozenset[StandardCoord]:
+        """Return the coordinates covered by a finite beam (excluding its origin).
+
+        Note. Materialised on first access and kept for the lifetime of the beam, so beams
+        that survive pruning are not re-materialised on every check.
+
+        """
+
+        beam_len = max(self.x.get_length(), self.y.get_length(), self.z.get_length())
+        if beam_len == np.inf:
+            raise ValueError("Infinite beams cannot be materialised.")
+
+        return frozenset(
+            (
+                self.x.start + i * self.x.direction,
+                self.y.start + i * self.y.direction,
+                self.z.start + i * self.z.direction,
+            )
+            for i in range(1, int(beam_len) + 1)
+        )
+
     def to_array(self, len_of_materialised_beam: int) -> list[StandardCoord]:
         """Convert beam into an array of 3D coordinates of arbitrary length."""
 